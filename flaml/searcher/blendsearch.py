@@ -4,7 +4,9 @@
  * project root for license information.
 '''
 from typing import Dict, Optional, List, Tuple, Callable
+from functools import lru_cache
 import numpy as np
+import sys
 import time
 import pickle
 
@@ -12,16 +14,21 @@ try:
     from ray.tune.suggest import Searcher
     from ray.tune.suggest.optuna import OptunaSearch as GlobalSearch
     from ray.tune.suggest.variant_generator import generate_variants
+    from ray.tune.sample import Domain
 except ImportError:
     from .suggestion import Searcher
     from .suggestion import OptunaSearch as GlobalSearch
     from .variant_generator import generate_variants
+    from ..tune.sample import Domain
 from .search_thread import SearchThread
 from .flow2 import FLOW2
 
 import logging
 logger = logging.getLogger(__name__)
 
+# sentinel distinguishing a missing key from a stored None result
+_MISSING = object()
+
 
 class BlendSearch(Searcher):
     '''class for BlendSearch algorithm
@@ -119,9 +126,19 @@ class BlendSearch(Searcher):
         self._points_to_evaluate = points_to_evaluate or []
         self._config_constraints = config_constraints
         self._metric_constraints = metric_constraints
+        # fast path for the common no-constraint case in the hot callbacks
+        self._has_metric_constraints = bool(metric_constraints)
+        # (metric, sign as +-1, threshold), parsed once instead of
+        # comparing the sign string on every completed trial
+        self._metric_constraints_parsed = [
+            (m, 1 if sign == '<=' else -1, threshold)
+            for m, sign, threshold in metric_constraints
+        ] if metric_constraints else None
         if self._metric_constraints:
             # metric modified by lagrange
             metric += self.lagrange
+        # avoid re-concatenating the modified metric name per result
+        self._lagrange_metric = metric if metric_constraints else None
         if global_search_alg is not None:
             self._gs = global_search_alg
         elif getattr(self, '__name__', None) != 'CFO':
@@ -142,6 +159,8 @@ class BlendSearch(Searcher):
         self._ls = self.LocalSearch(
             init_config, metric, mode, cat_hp_cost, space, prune_attr,
             min_resource, max_resource, reduction_factor, self.cost_attr, seed)
+        self._searchers = (self._ls,) if self._gs is None \
+            else (self._ls, self._gs)
         self._init_search()
 
     def set_search_properties(self,
@@ -155,22 +174,18 @@ class BlendSearch(Searcher):
             if self._metric_constraints:
                 # metric modified by lagrange
                 metric += self.lagrange
+                self._lagrange_metric = metric
                 # TODO: don't change metric for global search methods that
                 # can handle constraints already
         if mode and self._mode != mode:
             mode_changed = True
             self._mode = mode
-        if not self._ls.space:
-            # the search space can be set only once
-            self._ls.set_search_properties(metric, mode, config)
-            if self._gs is not None:
-                self._gs.set_search_properties(metric, mode, config)
-            self._init_search()
-        elif metric_changed or mode_changed:
-            # reset search when metric or mode changed
-            self._ls.set_search_properties(metric, mode)
-            if self._gs is not None:
-                self._gs.set_search_properties(metric, mode)
+        if not self._ls.space or metric_changed or mode_changed:
+            # set the search space (it can be set only once), or reset
+            # the search when the metric or mode changed
+            space = config if not self._ls.space else None
+            for searcher in self._searchers:
+                searcher.set_search_properties(metric, mode, space)
             self._init_search()
         if config:
             if 'time_budget_s' in config:
@@ -191,13 +206,26 @@ class BlendSearch(Searcher):
             0: SearchThread(self._ls.mode, self._gs)
         }
         self._thread_count = 1  # total # threads created
+        # the cached best signed objective depends on metric and mode,
+        # which may have changed when the search is re-initialized
+        self._candidate_obj_best = None
         self._init_used = self._ls.init_config is None
-        self._trial_proposed_by = {}  # trial_id: str -> thread_id: int
+        # trial_id: str -> (thread_id: int, config: Dict)
+        self._trial_proposed_by = {}
         self._ls_bound_min = self._ls.normalize(self._ls.init_config)
         self._ls_bound_max = self._ls_bound_min.copy()
         self._gs_admissible_min = self._ls_bound_min.copy()
         self._gs_admissible_max = self._ls_bound_max.copy()
-        self._result = {}  # config_signature: tuple -> result: Dict
+        # whether the admissible region equals the ls bounding box,
+        # to skip redundant resets
+        self._admissible_synced = True
+        # config_signature: tuple -> result: Dict
+        # the searcher runs in the driver process only, so this single
+        # dict already deduplicates configs across parallel trials
+        self._result = {}
+        self._sig_cache = {}  # id(config) -> (config, signature)
+        # whether the space is free of dependent/grid values; lazily decided
+        self._space_independent = None
         self._deadline = np.inf
         if self._metric_constraints:
             self._metric_constraint_satisfied = False
@@ -212,7 +240,7 @@ class BlendSearch(Searcher):
         '''
         save_object = self
         with open(checkpoint_path, "wb") as outputFile:
-            pickle.dump(save_object, outputFile)
+            pickle.dump(save_object, outputFile, pickle.HIGHEST_PROTOCOL)
 
     def restore(self, checkpoint_path: str):
         ''' restore states from checkpoint
@@ -228,17 +256,30 @@ class BlendSearch(Searcher):
         self._ls_bound_max = state._ls_bound_max
         self._gs_admissible_min = state._gs_admissible_min
         self._gs_admissible_max = state._gs_admissible_max
+        self._admissible_synced = False  # resync on the next occasion
         self._result = state._result
+        self._sig_cache = {}  # object ids are not preserved by pickle
+        self._space_independent = None  # re-decide for the restored space
         self._deadline = state._deadline
         self._metric, self._mode = state._metric, state._mode
         self._points_to_evaluate = state._points_to_evaluate
         self._gs = state._gs
         self._ls = state._ls
+        self._searchers = (self._ls,) if self._gs is None \
+            else (self._ls, self._gs)
         self._config_constraints = state._config_constraints
         self._metric_constraints = state._metric_constraints
+        self._has_metric_constraints = bool(state._metric_constraints)
+        self._metric_constraints_parsed = [
+            (m, 1 if sign == '<=' else -1, threshold)
+            for m, sign, threshold in state._metric_constraints
+        ] if state._metric_constraints else None
+        self._lagrange_metric = (
+            self._metric + self.lagrange) if state._metric_constraints else None
         self._metric_constraint_satisfied = state._metric_constraint_satisfied
         self._metric_constraint_penalty = state._metric_constraint_penalty
         self._candidate_start_points = state._candidate_start_points
+        self._candidate_obj_best = None  # recomputed on demand
         if self._candidate_start_points:
             self._started_from_given = state._started_from_given
             self._started_from_low_cost = state._started_from_low_cost
@@ -247,20 +288,50 @@ class BlendSearch(Searcher):
     def metric_target(self):
         return self._metric_target
 
+    def _random_config(self) -> Dict:
+        ''' sample one random config from the search space
+        '''
+        space = self._ls.space
+        if self._space_independent is None:
+            # a flat space of dependency-free domains can be sampled
+            # directly, skipping the deepcopy and spec parsing which
+            # generate_variants repeats on every call
+            self._space_independent = all(
+                not (isinstance(domain, dict)
+                     or isinstance(domain, Domain)
+                     and (domain.is_grid() or domain.is_function()))
+                for domain in space.values())
+        if self._space_independent:
+            return {
+                key: domain.sample() if isinstance(domain, Domain) else domain
+                for key, domain in space.items()}
+        for _, generated in generate_variants({'config': space}):
+            return generated['config']
+
+    def _sig(self, config: Dict) -> tuple:
+        ''' memoized config signature; a config dict is hashed several
+        times per trial, so cache the signature by config object
+        '''
+        key = id(config)
+        cached = self._sig_cache.get(key)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        signature = self._ls.config_signature(config)
+        self._sig_cache[key] = (config, signature)
+        return signature
+
     def on_trial_complete(self, trial_id: str, result: Optional[Dict] = None,
                           error: bool = False):
         ''' search thread updater and cleaner
         '''
         metric_constraint_satisfied = True
-        if result and not error and self._metric_constraints:
+        if result and not error and self._has_metric_constraints:
             # account for metric constraints if any
             objective = result[self._metric]
-            for i, constraint in enumerate(self._metric_constraints):
-                metric_constraint, sign, threshold = constraint
+            for i, constraint in enumerate(self._metric_constraints_parsed):
+                metric_constraint, sign_op, threshold = constraint
                 value = result.get(metric_constraint)
                 if value:
-                    # sign is <= or >=
-                    sign_op = 1 if sign == '<=' else -1
                     violation = (value - threshold) * sign_op
                     if violation > 0:
                         # add penalty term to the metric
@@ -269,25 +340,31 @@ class BlendSearch(Searcher):
                         metric_constraint_satisfied = False
                         if self._metric_constraint_penalty[i] < self.penalty:
                             self._metric_constraint_penalty[i] += violation
-            result[self._metric + self.lagrange] = objective
+            result[self._lagrange_metric] = objective
             if metric_constraint_satisfied and not self._metric_constraint_satisfied:
                 # found a feasible point
                 self._metric_constraint_penalty = [1 for _ in self._metric_constraints]
             self._metric_constraint_satisfied |= metric_constraint_satisfied
-        thread_id = self._trial_proposed_by.get(trial_id)
+        proposed = self._trial_proposed_by.pop(trial_id, None)
+        if proposed is not None:
+            thread_id, config = proposed
+        else:
+            thread_id = config = None
         if thread_id in self._search_thread_pool:
             self._search_thread_pool[thread_id].on_trial_complete(
                 trial_id, result, error)
-            del self._trial_proposed_by[trial_id]
         if result:
-            config = {}
-            for key, value in result.items():
-                if key.startswith('config/'):
-                    config[key[7:]] = value
+            if config is None:
+                # not proposed by this searcher; rebuild from the result
+                config = {}
+                for key, value in result.items():
+                    if key.startswith('config/'):
+                        config[key[7:]] = value
+            signature = self._sig(config)
             if error:  # remove from result cache
-                del self._result[self._ls.config_signature(config)]
+                del self._result[signature]
             else:  # add to result cache
-                self._result[self._ls.config_signature(config)] = result
+                self._result[signature] = result
                 # update target metric if improved
                 objective = result[self._ls.metric]
                 if (objective - self._metric_target) * self._ls.metric_op < 0:
@@ -296,19 +373,22 @@ class BlendSearch(Searcher):
                    and self._create_condition(result):
                     # thread creator
                     thread_id = self._thread_count
-                    self._started_from_given = self._candidate_start_points \
-                        and trial_id in self._candidate_start_points
-                    if self._started_from_given:
-                        del self._candidate_start_points[trial_id]
-                    else:
+                    candidates = self._candidate_start_points
+                    # pop probes and removes in a single lookup
+                    popped = candidates.pop(trial_id, _MISSING) \
+                        if candidates else _MISSING
+                    self._started_from_given = popped is not _MISSING
+                    if not self._started_from_given:
                         self._started_from_low_cost = True
                     self._create_thread(config, result)
                 elif thread_id and not self._metric_constraint_satisfied:
                     # no point has been found to satisfy metric constraint
                     self._expand_admissible_region()
                 # reset admissible region to ls bounding box
-                self._gs_admissible_min.update(self._ls_bound_min)
-                self._gs_admissible_max.update(self._ls_bound_max)
+                if not self._admissible_synced:
+                    self._gs_admissible_min.update(self._ls_bound_min)
+                    self._gs_admissible_max.update(self._ls_bound_max)
+                    self._admissible_synced = True
         # cleaner
         if thread_id and thread_id in self._search_thread_pool:
             # local search thread
@@ -324,27 +404,40 @@ class BlendSearch(Searcher):
             self.cost_attr
         )
         self._thread_count += 1
-        self._update_admissible_region(
-            config, self._ls_bound_min, self._ls_bound_max)
+        if self._update_admissible_region(
+                config, self._ls_bound_min, self._ls_bound_max):
+            self._admissible_synced = False
 
-    def _update_admissible_region(self, config, admissible_min, admissible_max):
+    def _update_admissible_region(self, config, admissible_min, admissible_max,
+                                  normalized_config=None):
         # update admissible region
-        normalized_config = self._ls.normalize(config)
-        for key in admissible_min:
+        if normalized_config is None:
+            normalized_config = self._ls.normalize(config)
+        changed = False
+        for key, lower in admissible_min.items():
             value = normalized_config[key]
             if value > admissible_max[key]:
                 admissible_max[key] = value
-            elif value < admissible_min[key]:
+                changed = True
+            elif value < lower:
                 admissible_min[key] = value
+                changed = True
+        return changed
 
     def _create_condition(self, result: Dict) -> bool:
         ''' create thread condition
         '''
         if len(self._search_thread_pool) < 2:
             return True
-        obj_median = np.median(
-            [thread.obj_best1 for id, thread in self._search_thread_pool.items()
-             if id])
+        # the thread pool is small, so a plain sort is cheaper than np.median
+        obj_list = [thread.obj_best1
+                    for id, thread in self._search_thread_pool.items() if id]
+        obj_list.sort()
+        n = len(obj_list)
+        if n % 2:
+            obj_median = obj_list[n // 2]
+        else:
+            obj_median = (obj_list[n // 2 - 1] + obj_list[n // 2]) / 2
         return result[self._ls.metric] * self._ls.metric_op < obj_median
 
     def _clean(self, thread_id: int):
@@ -357,11 +450,8 @@ class BlendSearch(Searcher):
             if id and id != thread_id:
                 if self._inferior(id, thread_id):
                     todelete.add(id)
-        for id in self._search_thread_pool:
-            if id and id != thread_id:
-                if self._inferior(thread_id, id):
+                if thread_id not in todelete and self._inferior(thread_id, id):
                     todelete.add(thread_id)
-                    break
         create_new = False
         if self._search_thread_pool[thread_id].converged:
             todelete.add(thread_id)
@@ -370,10 +460,11 @@ class BlendSearch(Searcher):
                 if not self._started_from_given:
                     # remove start points whose perf is worse than the converged
                     obj = self._search_thread_pool[thread_id].obj_best1
+                    metric, metric_op = self._ls.metric, self._ls.metric_op
                     worse = [
                         trial_id
                         for trial_id, r in self._candidate_start_points.items()
-                        if r and r[self._ls.metric] * self._ls.metric_op >= obj]
+                        if r and r[metric] * metric_op >= obj]
                     # logger.info(f"remove candidate start points {worse} than {obj}")
                     for trial_id in worse:
                         del self._candidate_start_points[trial_id]
@@ -388,11 +479,13 @@ class BlendSearch(Searcher):
         # find the best start point
         best_trial_id = None
         obj_best = None
+        metric, metric_op = self._ls.metric, self._ls.metric_op
         for trial_id, r in self._candidate_start_points.items():
-            if r and (best_trial_id is None
-                      or r[self._ls.metric] * self._ls.metric_op < obj_best):
-                best_trial_id = trial_id
-                obj_best = r[self._ls.metric] * self._ls.metric_op
+            if r:
+                obj = r[metric] * metric_op
+                if best_trial_id is None or obj < obj_best:
+                    best_trial_id = trial_id
+                    obj_best = obj
         if best_trial_id:
             # create a new thread
             config = {}
@@ -405,9 +498,12 @@ class BlendSearch(Searcher):
             self._create_thread(config, result)
 
     def _expand_admissible_region(self):
-        for key in self._ls_bound_max:
-            self._ls_bound_max[key] += self._ls.STEPSIZE
-            self._ls_bound_min[key] -= self._ls.STEPSIZE
+        step = self._ls.STEPSIZE
+        self._ls_bound_max = {
+            key: value + step for key, value in self._ls_bound_max.items()}
+        self._ls_bound_min = {
+            key: value - step for key, value in self._ls_bound_min.items()}
+        self._admissible_synced = False
 
     def _inferior(self, id1: int, id2: int) -> bool:
         ''' whether thread id1 is inferior to id2
@@ -425,18 +521,21 @@ class BlendSearch(Searcher):
     def on_trial_result(self, trial_id: str, result: Dict):
         ''' receive intermediate result
         '''
-        if trial_id not in self._trial_proposed_by:
+        proposed = self._trial_proposed_by.get(trial_id)
+        if proposed is None:
             return
-        thread_id = self._trial_proposed_by[trial_id]
-        if thread_id not in self._search_thread_pool:
+        thread = self._search_thread_pool.get(proposed[0])
+        if thread is None:
             return
-        if result and self._metric_constraints:
-            result[self._metric + self.lagrange] = result[self._metric]
-        self._search_thread_pool[thread_id].on_trial_result(trial_id, result)
+        if result and self._has_metric_constraints:
+            result[self._lagrange_metric] = result[self._metric]
+        thread.on_trial_result(trial_id, result)
 
     def suggest(self, trial_id: str) -> Optional[Dict]:
         ''' choose thread, suggest a valid config
         '''
+        # config dicts from the last trial are not reused across trials
+        self._sig_cache.clear()
         if self._init_used and not self._points_to_evaluate:
             choice, backup = self._select_thread()
             if choice < 0:  # timeout
@@ -454,42 +553,56 @@ class BlendSearch(Searcher):
                 if choice:
                     return None
                 # use rs when BO fails to suggest a config
-                for _, generated in generate_variants({'config': self._ls.space}):
-                    config = generated['config']
-                    break  # get one random config
+                config = self._random_config()
                 skip = self._should_skip(-1, trial_id, config)
                 if skip:
                     return None
-            if choice or self._valid(config):
+            # share one normalized view between _valid and the
+            # admissible-region update for global search proposals
+            normalized_config = None if choice else self._ls.normalize(config)
+            if choice or self._valid(config, normalized_config):
                 # LS or valid or no backup choice
-                self._trial_proposed_by[trial_id] = choice
+                self._trial_proposed_by[trial_id] = (choice, config)
             else:  # invalid config proposed by GS
                 if choice == backup:
                     # use CFO's init point
                     init_config = self._ls.init_config
                     config = self._ls.complete_config(
                         init_config, self._ls_bound_min, self._ls_bound_max)
-                    self._trial_proposed_by[trial_id] = choice
+                    self._trial_proposed_by[trial_id] = (choice, config)
+                    normalized_config = None
                 else:
                     config = self._search_thread_pool[backup].suggest(trial_id)
                     skip = self._should_skip(backup, trial_id, config)
                     if skip:
                         return None
-                    self._trial_proposed_by[trial_id] = backup
+                    self._trial_proposed_by[trial_id] = (backup, config)
                     choice = backup
             if not choice:  # global search
                 if self._ls._resource:
                     # TODO: min or median?
                     config[self._ls.prune_attr] = self._ls.min_resource
+                    # the signature memoized before the mutation no
+                    # longer matches config_signature of this config
+                    self._sig_cache.pop(id(config), None)
+                    if normalized_config is not None:
+                        # the prune_attr is not normalized
+                        normalized_config[self._ls.prune_attr] = \
+                            self._ls.min_resource
                 # temporarily relax admissible region for parallel proposals
-                self._update_admissible_region(
-                    config, self._gs_admissible_min, self._gs_admissible_max)
+                if self._update_admissible_region(
+                        config, self._gs_admissible_min,
+                        self._gs_admissible_max, normalized_config):
+                    self._admissible_synced = False
             else:
-                self._update_admissible_region(
-                    config, self._ls_bound_min, self._ls_bound_max)
-                self._gs_admissible_min.update(self._ls_bound_min)
-                self._gs_admissible_max.update(self._ls_bound_max)
-            self._result[self._ls.config_signature(config)] = {}
+                if self._update_admissible_region(
+                        config, self._ls_bound_min, self._ls_bound_max):
+                    self._admissible_synced = False
+                if not self._admissible_synced:
+                    self._gs_admissible_min.update(self._ls_bound_min)
+                    self._gs_admissible_max.update(self._ls_bound_max)
+                    self._admissible_synced = True
+            self._result[self._sig(config)] = {}
         else:  # use init config
             if self._candidate_start_points is not None and self._points_to_evaluate:
                 self._candidate_start_points[trial_id] = None
@@ -497,16 +610,13 @@ class BlendSearch(Searcher):
                 0) if self._points_to_evaluate else self._ls.init_config
             config = self._ls.complete_config(
                 init_config, self._ls_bound_min, self._ls_bound_max)
-            config_signature = self._ls.config_signature(config)
-            result = self._result.get(config_signature)
-            if result:  # tried before
-                return None
-            elif result is None:  # not tried before
-                self._result[config_signature] = {}
-            else:  # running but no result yet
+            config_signature = self._sig(config)
+            if self._result.get(config_signature) is not None:
+                # tried before, either finished or still running
                 return None
+            self._result[config_signature] = {}
             self._init_used = True
-            self._trial_proposed_by[trial_id] = 0
+            self._trial_proposed_by[trial_id] = (0, config)
             self._search_thread_pool[0].running += 1
         return config
 
@@ -516,16 +626,17 @@ class BlendSearch(Searcher):
         '''
         if config is None:
             return True
-        config_signature = self._ls.config_signature(config)
-        exists = config_signature in self._result
+        config_signature = self._sig(config)
+        # cached values are never None, so one lookup decides membership
+        result = self._result.get(config_signature)
+        exists = result is not None
         # check constraints
         if not exists and self._config_constraints:
-            for constraint in self._config_constraints:
-                func, sign, threshold = constraint
+            for func, sign, threshold in self._config_constraints:
                 value = func(config)
                 if (sign == '<=' and value > threshold
                         or sign == '>=' and value < threshold):
-                    self._result[config_signature] = {
+                    result = self._result[config_signature] = {
                         self._metric: np.inf * self._ls.metric_op,
                         'time_total_s': 1,
                     }
@@ -533,7 +644,6 @@ class BlendSearch(Searcher):
                     break
         if exists:  # suggested before
             if choice >= 0:  # not fallback to rs
-                result = self._result.get(config_signature)
                 if result:  # finished
                     self._search_thread_pool[choice].on_trial_complete(
                         trial_id, result, error=False)
@@ -556,44 +666,51 @@ class BlendSearch(Searcher):
             # return -1, -1
             # keep proposing new configs assuming no budget left
             min_eci = 0
+        pool = self._search_thread_pool
         max_speed = 0
-        for thread in self._search_thread_pool.values():
+        for thread in pool.values():
             if thread.speed > max_speed:
                 max_speed = thread.speed
-        for thread in self._search_thread_pool.values():
-            thread.update_eci(self._metric_target, max_speed)
+        metric_target = self._metric_target
+        for thread in pool.values():
+            thread.update_eci(metric_target, max_speed)
             if thread.eci < min_eci:
                 min_eci = thread.eci
-        for thread in self._search_thread_pool.values():
-            thread.update_priority(min_eci)
-
+        # update priority and select top/backup in a single pass
+        thread0 = pool[0]
+        thread0.update_priority(min_eci)
         top_thread_id = backup_thread_id = 0
-        priority1 = priority2 = self._search_thread_pool[0].priority
-        for thread_id, thread in self._search_thread_pool.items():
+        priority1 = priority2 = thread0.priority
+        for thread_id, thread in pool.items():
             # if thread_id:
             #     print(
             #         f"priority of thread {thread_id}={thread.priority}")
             #     logger.debug(
             #         f"thread {thread_id}.can_suggest={thread.can_suggest}")
-            if thread_id and thread.can_suggest:
-                priority = thread.priority
-                if priority > priority1:
-                    priority1 = priority
-                    top_thread_id = thread_id
-                if priority > priority2 or backup_thread_id == 0:
-                    priority2 = priority
-                    backup_thread_id = thread_id
+            if thread_id:
+                thread.update_priority(min_eci)
+                if thread.can_suggest:
+                    priority = thread.priority
+                    if priority > priority1:
+                        priority1 = priority
+                        top_thread_id = thread_id
+                    if priority > priority2 or backup_thread_id == 0:
+                        priority2 = priority
+                        backup_thread_id = thread_id
         return top_thread_id, backup_thread_id
 
-    def _valid(self, config: Dict) -> bool:
+    def _valid(self, config: Dict, normalized_config=None) -> bool:
         ''' config validator
         '''
-        normalized_config = self._ls.normalize(config)
-        for key in self._gs_admissible_min:
+        if normalized_config is None:
+            normalized_config = self._ls.normalize(config)
+        stepsize = self._ls.STEPSIZE
+        admissible_max = self._gs_admissible_max
+        for key, lower in self._gs_admissible_min.items():
             if key in config:
                 value = normalized_config[key]
-                if value + self._ls.STEPSIZE < self._gs_admissible_min[key] \
-                        or value > self._gs_admissible_max[key] + self._ls.STEPSIZE:
+                if value + stepsize < lower \
+                        or value > admissible_max[key] + stepsize:
                     return False
         return True
 
@@ -605,6 +722,51 @@ except ImportError:
     from ..tune.sample import (uniform, quniform, choice, randint, qrandint, randn,
                                qrandn, loguniform, qloguniform)
 
+# domain constructors by NNI search-space type, resolved in one dict
+# lookup instead of an if/elif chain per key
+_NNI_TYPE_TO_DOMAIN = {
+    'choice': lambda v: choice(v),
+    'randint': lambda v: randint(v[0], v[1] - 1),
+    'uniform': lambda v: uniform(v[0], v[1]),
+    'quniform': lambda v: quniform(v[0], v[1], v[2]),
+    'loguniform': lambda v: loguniform(v[0], v[1]),
+    'qloguniform': lambda v: qloguniform(v[0], v[1], v[2]),
+    'normal': lambda v: randn(v[1], v[2]),
+    'qnormal': lambda v: qrandn(v[1], v[2], v[3]),
+}
+
+
+# message for a dispatch miss, formatted only on the error path
+_NNI_UNSUPPORTED_TYPE = 'unsupported type in search_space {}'
+
+
+def _nni_space_key(search_space: Dict) -> Tuple:
+    '''canonicalize an NNI search space to a hashable key
+    '''
+    items = []
+    for key, value in search_space.items():
+        v = value.get('_value')
+        if isinstance(v, list):
+            v = tuple(v)
+        # interning lets dispatch and cache-key comparisons short-circuit
+        # on identity; JSON-loaded strings are not interned by default
+        items.append((key, sys.intern(value['_type']), v))
+    return tuple(items)
+
+
+@lru_cache(maxsize=32)
+def _parse_nni_space(space_key: Tuple) -> Dict:
+    '''build the domain dict for a canonicalized NNI search space,
+    reusing the parse when the same space is submitted repeatedly
+    '''
+    config = {}
+    for key, _type, v in space_key:
+        to_domain = _NNI_TYPE_TO_DOMAIN.get(_type)
+        if to_domain is None:
+            raise ValueError(_NNI_UNSUPPORTED_TYPE.format(_type))
+        config[key] = to_domain(v)
+    return config
+
 try:
     from nni.tuner import Tuner as NNITuner
     from nni.utils import extract_scalar_reward
@@ -613,6 +775,13 @@ try:
         '''Tuner class for NNI
         '''
 
+        # no instance state beyond BlendSearch; the bases are unslotted
+        # so this only avoids growing the layout, not the __dict__
+        __slots__ = ()
+
+        # nni is importable; the NNI tuner interface is active
+        _TUNER_AVAILABLE = True
+
         def receive_trial_result(self, parameter_id, parameters, value,
                                  **kwargs):
             '''
@@ -649,58 +818,55 @@ try:
             it should explicitly document this behaviour.
             search_space: JSON object created by experiment owner
             '''
-            config = {}
-            for key, value in search_space.items():
-                v = value.get("_value")
-                _type = value['_type']
-                if _type == 'choice':
-                    config[key] = choice(v)
-                elif _type == 'randint':
-                    config[key] = randint(v[0], v[1] - 1)
-                elif _type == 'uniform':
-                    config[key] = uniform(v[0], v[1])
-                elif _type == 'quniform':
-                    config[key] = quniform(v[0], v[1], v[2])
-                elif _type == 'loguniform':
-                    config[key] = loguniform(v[0], v[1])
-                elif _type == 'qloguniform':
-                    config[key] = qloguniform(v[0], v[1], v[2])
-                elif _type == 'normal':
-                    config[key] = randn(v[1], v[2])
-                elif _type == 'qnormal':
-                    config[key] = qrandn(v[1], v[2], v[3])
-                else:
-                    raise ValueError(
-                        f'unsupported type in search_space {_type}')
-            self._ls.set_search_properties(None, None, config)
-            if self._gs is not None:
-                self._gs.set_search_properties(None, None, config)
+            try:
+                config = dict(_parse_nni_space(_nni_space_key(search_space)))
+            except TypeError:
+                # unhashable values (e.g. nested choice lists) cannot be
+                # memoized; parse directly
+                config = {}
+                for key, value in search_space.items():
+                    v = value.get("_value")
+                    _type = sys.intern(value['_type'])
+                    to_domain = _NNI_TYPE_TO_DOMAIN.get(_type)
+                    if to_domain is None:
+                        raise ValueError(_NNI_UNSUPPORTED_TYPE.format(_type))
+                    config[key] = to_domain(v)
+            for searcher in self._searchers:
+                searcher.set_search_properties(None, None, config)
             self._init_search()
 
 except ImportError:
     class BlendSearchTuner(BlendSearch):
-        pass
+        # placeholder without nni; lets callers skip tuner-only paths
+        # with a class-attribute check instead of feature probing
+        __slots__ = ()
+        _TUNER_AVAILABLE = False
 
 
 class CFO(BlendSearchTuner):
     ''' class for CFO algorithm
     '''
 
+    __slots__ = ()
+
     __name__ = 'CFO'
 
     def suggest(self, trial_id: str) -> Optional[Dict]:
         # Number of threads is 1 or 2. Thread 0 is a vacuous thread
-        assert len(self._search_thread_pool) < 3, len(self._search_thread_pool)
-        if len(self._search_thread_pool) < 2:
+        num_threads = len(self._search_thread_pool)
+        assert num_threads < 3, num_threads
+        if num_threads < 2:
             # When a local thread converges, the number of threads is 1
             # Need to restart
             self._init_used = False
         return super().suggest(trial_id)
 
     def _select_thread(self) -> Tuple:
-        for key in self._search_thread_pool:
-            if key:
-                return key, key
+        # the pool holds at most the vacuous thread 0 and one local
+        # thread, so the local thread id is the largest key
+        key = max(self._search_thread_pool)
+        if key:
+            return key, key
 
     def _create_condition(self, result: Dict) -> bool:
         ''' create thread condition
@@ -714,19 +880,42 @@ class CFO(BlendSearchTuner):
             return False
         if self._candidate_start_points and self._thread_count == 1:
             # result needs to match or exceed the best candidate start point
-            obj_best = min(
-                self._ls.metric_op * r[self._ls.metric]
-                for r in self._candidate_start_points.values() if r)
-            return result[self._ls.metric] * self._ls.metric_op <= obj_best
+            ls = self._ls
+            metric, metric_op = ls.metric, ls.metric_op
+            obj_best = self._candidate_obj_best
+            if obj_best is None:
+                values = [r[metric]
+                          for r in self._candidate_start_points.values() if r]
+                if len(values) >= 64:
+                    # large warm-start pools: one C-level reduction beats
+                    # the interpreter loop
+                    obj_best = float((np.asarray(values) * metric_op).min())
+                else:
+                    # manual loop over locals is cheaper than a genexpr here
+                    obj_best = np.inf
+                    for value in values:
+                        obj = metric_op * value
+                        if obj < obj_best:
+                            obj_best = obj
+                if values:
+                    # keep the recomputed value for subsequent calls
+                    self._candidate_obj_best = obj_best
+            return result[metric] * metric_op <= obj_best
         else:
             return True
 
     def on_trial_complete(self, trial_id: str, result: Optional[Dict] = None,
                           error: bool = False):
         super().on_trial_complete(trial_id, result, error)
-        if self._candidate_start_points \
-           and trial_id in self._candidate_start_points:
+        candidates = self._candidate_start_points
+        if candidates \
+                and candidates.get(trial_id, _MISSING) is not _MISSING:
             # the trial is a candidate start point
-            self._candidate_start_points[trial_id] = result
+            candidates[trial_id] = result
+            if result:
+                obj = result[self._ls.metric] * self._ls.metric_op
+                if self._candidate_obj_best is None \
+                   or obj < self._candidate_obj_best:
+                    self._candidate_obj_best = obj
             if len(self._search_thread_pool) < 2 and not self._points_to_evaluate:
                 self._create_thread_from_best_candidate()
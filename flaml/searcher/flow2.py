@@ -103,6 +103,8 @@ class FLOW2(Searcher):
         self.max_resource = max_resource
         self._resource = None
         self._step_lb = np.Inf
+        # key -> pre-parsed sampler record used by normalize/denormalize
+        self._space_info = {}
         if space:
             self._init_search()
 
@@ -158,6 +160,36 @@ class FLOW2(Searcher):
                         self._unordered_cat_hp[key] = len(domain.categories)
                 if str(sampler) != 'Normal':
                     self._bounded_keys.append(key)
+        # pre-parse each domain into
+        # (kind, p1, p2, p3, q, is_int) so that normalize/denormalize
+        # don't re-fetch the sampler and compare its type per call;
+        # keys without a record pass through unchanged
+        self._space_info = {}
+        for key, domain in self.space.items():
+            if not callable(getattr(domain, 'get_sampler', None)):
+                continue
+            if isinstance(domain, sample.Categorical):
+                self._space_info[key] = ('cat', None, None, None, None, False)
+                continue
+            sampler = domain.get_sampler()
+            q = None
+            if isinstance(sampler, sample.Quantized):
+                q = sampler.q
+                sampler = sampler.get_sampler()
+            is_int = isinstance(domain, sample.Integer)
+            sampler_str = str(sampler)
+            if sampler_str == 'LogUniform':
+                info = ('log', domain.lower, domain.upper / domain.lower,
+                        np.log(domain.upper / domain.lower), q, is_int)
+            elif sampler_str == 'Uniform':
+                info = ('lin', domain.lower, domain.upper - domain.lower,
+                        None, q, is_int)
+            elif sampler_str == 'Normal':
+                info = ('norm', sampler.mean, sampler.sd, None, q, is_int)
+            else:
+                # e.g., sample.Function samplers: value passes through
+                info = ('other', None, None, None, q, is_int)
+            self._space_info[key] = info
         self._space_keys = list(self.space.keys())
         if (self.prune_attr and self.prune_attr not in self.space
                 and self.max_resource):
@@ -304,49 +336,40 @@ class FLOW2(Searcher):
         ''' normalize each dimension in config to [0,1]
         '''
         config_norm = {}
+        space_info = self._space_info
         for key, value in flatten_dict(config).items():
-            if key in self.space:
-                # domain: sample.Categorical/Integer/Float/Function
-                domain = self.space[key]
-                if not callable(getattr(domain, 'get_sampler', None)):
-                    config_norm[key] = value
+            info = space_info.get(key)
+            if info is None:
+                # prune_attr, constant, or not in space
+                config_norm[key] = value
+                continue
+            kind = info[0]
+            if kind == 'cat':
+                # normalize categorical
+                if key in self._ordered_cat_hp:
+                    l, d = self._ordered_cat_hp[key]
+                    config_norm[key] = (d[value] + 0.5) / len(l)
+                elif key in self._ordered_choice_hp:
+                    l, d = self._ordered_choice_hp[key]
+                    config_norm[key] = (d[value] + 0.5) / len(l)
+                elif key in self.incumbent:
+                    config_norm[key] = self.incumbent[
+                        key] if value == self.best_config[
+                            key] else (
+                                self.incumbent[key]
+                                + 1.0 / self._unordered_cat_hp[key]) % 1
                 else:
-                    if isinstance(domain, sample.Categorical):
-                        # normalize categorical
-                        if key in self._ordered_cat_hp:
-                            l, d = self._ordered_cat_hp[key]
-                            config_norm[key] = (d[value] + 0.5) / len(l)
-                        elif key in self._ordered_choice_hp:
-                            l, d = self._ordered_choice_hp[key]
-                            config_norm[key] = (d[value] + 0.5) / len(l)
-                        elif key in self.incumbent:
-                            config_norm[key] = self.incumbent[
-                                key] if value == self.best_config[
-                                    key] else (
-                                        self.incumbent[key]
-                                        + 1.0 / self._unordered_cat_hp[key]) % 1
-                        else:
-                            config_norm[key] = 0.5
-                        continue
-                    # Uniform/LogUniform/Normal/Base
-                    sampler = domain.get_sampler()
-                    if isinstance(sampler, sample.Quantized):
-                        # sampler is sample.Quantized
-                        sampler = sampler.get_sampler()
-                    if str(sampler) == 'LogUniform':
-                        config_norm[key] = np.log(value / domain.lower) / np.log(
-                            domain.upper / domain.lower)
-                    elif str(sampler) == 'Uniform':
-                        config_norm[key] = (
-                            value - domain.lower) / (domain.upper - domain.lower)
-                    elif str(sampler) == 'Normal':
-                        # N(mean, sd) -> N(0,1)
-                        config_norm[key] = (value - sampler.mean) / sampler.sd
-                    else:
-                        # TODO? elif str(sampler) == 'Base': # sample.Function._CallSampler
-                        # e.g., {test: sample_from(lambda spec: randn(10, 2).sample() * 0.01)}
-                        config_norm[key] = value
-            else:  # prune_attr
+                    config_norm[key] = 0.5
+            elif kind == 'log':
+                config_norm[key] = np.log(value / info[1]) / info[3]
+            elif kind == 'lin':
+                config_norm[key] = (value - info[1]) / info[2]
+            elif kind == 'norm':
+                # N(mean, sd) -> N(0,1)
+                config_norm[key] = (value - info[1]) / info[2]
+            else:
+                # TODO? 'other': # sample.Function._CallSampler
+                # e.g., {test: sample_from(lambda spec: randn(10, 2).sample() * 0.01)}
                 config_norm[key] = value
         return config_norm
 
@@ -354,60 +377,49 @@ class FLOW2(Searcher):
         ''' denormalize each dimension in config from [0,1]
         '''
         config_denorm = {}
+        space_info = self._space_info
         for key, value in config.items():
-            if key in self.space:
-                # domain: sample.Categorical/Integer/Float/Function
-                domain = self.space[key]
-                if not callable(getattr(domain, 'get_sampler', None)):
-                    config_denorm[key] = value
-                else:
-                    if isinstance(domain, sample.Categorical):
-                        # denormalize categorical
-                        if key in self._ordered_cat_hp:
-                            l, _ = self._ordered_cat_hp[key]
-                            n = len(l)
-                            config_denorm[key] = l[min(n - 1, int(np.floor(value * n)))]
-                        elif key in self._ordered_choice_hp:
-                            l, _ = self._ordered_choice_hp[key]
-                            n = len(l)
-                            config_denorm[key] = l[min(n - 1, int(np.floor(value * n)))]
-                        else:
-                            assert key in self.incumbent
-                            n = self._unordered_cat_hp[key]
-                            if np.floor(value * n) == np.floor(self.incumbent[key] * n):
-                                config_denorm[key] = self.best_config[key]
-                            else:  # ****random value each time!****
-                                config_denorm[key] = self._random.choice(
-                                    [x for x in domain.categories
-                                     if x != self.best_config[key]])
-                        continue
-                    # Uniform/LogUniform/Normal/Base
-                    sampler = domain.get_sampler()
-                    if isinstance(sampler, sample.Quantized):
-                        # sampler is sample.Quantized
-                        sampler = sampler.get_sampler()
-                    # Handle Log/Uniform
-                    if str(sampler) == 'LogUniform':
-                        config_denorm[key] = (
-                            domain.upper / domain.lower) ** value * domain.lower
-                    elif str(sampler) == 'Uniform':
-                        config_denorm[key] = value * (
-                            domain.upper - domain.lower) + domain.lower
-                    elif str(sampler) == 'Normal':
-                        # denormalization for 'Normal'
-                        config_denorm[key] = value * sampler.sd + sampler.mean
-                    else:
-                        config_denorm[key] = value
-                    # Handle quantized
-                    sampler = domain.get_sampler()
-                    if isinstance(sampler, sample.Quantized):
-                        config_denorm[key] = np.round(
-                            np.divide(config_denorm[key], sampler.q)) * sampler.q
-                    # Handle int (4.6 -> 5)
-                    if isinstance(domain, sample.Integer):
-                        config_denorm[key] = int(round(config_denorm[key]))
-            else:  # prune_attr
+            info = space_info.get(key)
+            if info is None:
+                # prune_attr, constant, or not in space
                 config_denorm[key] = value
+                continue
+            kind = info[0]
+            if kind == 'cat':
+                # denormalize categorical
+                if key in self._ordered_cat_hp:
+                    l, _ = self._ordered_cat_hp[key]
+                    n = len(l)
+                    config_denorm[key] = l[min(n - 1, int(np.floor(value * n)))]
+                elif key in self._ordered_choice_hp:
+                    l, _ = self._ordered_choice_hp[key]
+                    n = len(l)
+                    config_denorm[key] = l[min(n - 1, int(np.floor(value * n)))]
+                else:
+                    assert key in self.incumbent
+                    n = self._unordered_cat_hp[key]
+                    if np.floor(value * n) == np.floor(self.incumbent[key] * n):
+                        config_denorm[key] = self.best_config[key]
+                    else:  # ****random value each time!****
+                        config_denorm[key] = self._random.choice(
+                            [x for x in self.space[key].categories
+                             if x != self.best_config[key]])
+                continue
+            elif kind == 'log':
+                value = info[2] ** value * info[1]
+            elif kind == 'lin':
+                value = value * info[2] + info[1]
+            elif kind == 'norm':
+                value = value * info[2] + info[1]
+            # else 'other': value passes through
+            # Handle quantized
+            q = info[4]
+            if q is not None:
+                value = np.round(np.divide(value, q)) * q
+            # Handle int (4.6 -> 5)
+            if info[5]:
+                value = int(round(value))
+            config_denorm[key] = value
         return config_denorm
 
     def set_search_properties(self,
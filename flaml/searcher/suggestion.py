@@ -462,21 +462,28 @@ class OptunaSearch(Searcher):
                 "`seed` parameter has to be passed to the sampler directly "
                 "and will be ignored.")
 
-        self._sampler = sampler or ot.samplers.TPESampler(seed=seed)
+        if sampler:
+            assert isinstance(sampler, BaseSampler), \
+                "You can only pass an instance of " \
+                "`optuna.samplers.BaseSampler` as a sampler to " \
+                "`OptunaSearcher`."
+        # defer creating the sampler and study until a suggestion is needed,
+        # so that instances which only serve as placeholders (e.g., before a
+        # search space is set, or when all trials come from init points)
+        # don't pay for the study setup
+        self._sampler = sampler
+        self._seed = seed
 
-        assert isinstance(self._sampler, BaseSampler), \
-            "You can only pass an instance of `optuna.samplers.BaseSampler` " \
-            "as a sampler to `OptunaSearcher`."
+        if self._metric is None and self._mode:
+            # If only a mode was passed, use anonymous metric
+            self._metric = DEFAULT_METRIC
 
         self._ot_trials = {}
         self._ot_study = None
-        if self._space:
-            self._setup_study(mode)
 
     def _setup_study(self, mode: str):
-        if self._metric is None and self._mode:
-            # If only a mode was passed, use anonymous metric
-            self._metric = DEFAULT_METRIC
+        if self._sampler is None:
+            self._sampler = ot.samplers.TPESampler(seed=self._seed)
 
         pruner = ot.pruners.NopPruner()
         storage = ot.storages.InMemoryStorage()
@@ -508,8 +515,9 @@ class OptunaSearch(Searcher):
             self._metric = metric
         if mode:
             self._mode = mode
-
-        self._setup_study(mode)
+        if self._metric is None and self._mode:
+            # If only a mode was passed, use anonymous metric
+            self._metric = DEFAULT_METRIC
         return True
 
     def suggest(self, trial_id: str) -> Optional[Dict]:
@@ -524,6 +532,9 @@ class OptunaSearch(Searcher):
                     metric=self._metric,
                     mode=self._mode))
 
+        if self._ot_study is None:
+            self._setup_study(self._mode)
+
         if isinstance(self._space, list):
             # Keep for backwards compatibility
             # Deprecate: 1.5
@@ -589,6 +600,9 @@ class OptunaSearch(Searcher):
                     metric=self._metric,
                     mode=self._mode))
 
+        if self._ot_study is None:
+            self._setup_study(self._mode)
+
         ot_trial_state = OptunaTrialState.COMPLETE
         if error:
             ot_trial_state = OptunaTrialState.FAIL
@@ -616,7 +630,7 @@ class OptunaSearch(Searcher):
         save_object = (self._sampler, self._ot_trials, self._ot_study,
                        self._points_to_evaluate, self._evaluated_rewards)
         with open(checkpoint_path, "wb") as outputFile:
-            pickle.dump(save_object, outputFile)
+            pickle.dump(save_object, outputFile, pickle.HIGHEST_PROTOCOL)
 
     def restore(self, checkpoint_path: str):
         with open(checkpoint_path, "rb") as inputFile:
@@ -101,6 +101,8 @@ class LogUniform(Sampler):
     def __init__(self, base: float = 10):
         self.base = base
         assert self.base > 0, "Base has to be strictly greater than 0"
+        # cached for the exponent-space computations in sample()
+        self.recip_log_base = 1.0 / np.log(self.base)
 
     def __str__(self):
         return "LogUniform"
@@ -149,8 +151,8 @@ class Float(Domain):
                 "LogUniform needs a lower bound greater than 0"
             assert 0 < domain.upper < float("inf"), \
                 "LogUniform needs a upper bound greater than 0"
-            logmin = np.log(domain.lower) / np.log(self.base)
-            logmax = np.log(domain.upper) / np.log(self.base)
+            logmin = np.log(domain.lower) * self.recip_log_base
+            logmax = np.log(domain.upper) * self.recip_log_base
 
             items = self.base**(np.random.uniform(logmin, logmax, size=size))
             return items if len(items) > 1 else domain.cast(items[0])
@@ -254,8 +256,8 @@ class Integer(Domain):
                 "LogUniform needs a lower bound greater than 0"
             assert 0 < domain.upper < float("inf"), \
                 "LogUniform needs a upper bound greater than 0"
-            logmin = np.log(domain.lower) / np.log(self.base)
-            logmax = np.log(domain.upper) / np.log(self.base)
+            logmin = np.log(domain.lower) * self.recip_log_base
+            logmax = np.log(domain.upper) * self.recip_log_base
 
             items = self.base**(np.random.uniform(logmin, logmax, size=size))
             items = np.round(items).astype(int)
@@ -409,6 +411,9 @@ class Quantized(Sampler):
                size: int = 1):
         values = self.sampler.sample(domain, spec, size)
         quantized = np.round(np.divide(values, self.q)) * self.q
+        # rounding can push a boundary sample of e.g. a loguniform
+        # domain just outside the bounds; clamp it back
+        quantized = np.clip(quantized, domain.lower, domain.upper)
         if not isinstance(quantized, np.ndarray):
             return domain.cast(quantized)
         return list(quantized)
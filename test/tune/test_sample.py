@@ -0,0 +1,49 @@
+'''Tests for sampling domains and config-signature deduplication
+'''
+from flaml.tune.sample import qloguniform, qlograndint, qrandn
+
+
+def test_quantized_loguniform_in_bounds():
+    # rounding a boundary draw of qlograndint(1, 10, 3) used to
+    # produce 0, outside [lower, upper]; it must be clamped back
+    domain = qlograndint(1, 10, 3)
+    for value in domain.sample(size=1000):
+        assert 1 <= value <= 10
+    domain = qloguniform(5, 20, 5)
+    for value in domain.sample(size=1000):
+        assert 5 <= value <= 20
+
+
+def test_quantized_normal_unbounded():
+    # qrandn has no bounds; the clamp must leave its samples alone
+    samples = qrandn(5, 2, 0.5).sample(size=100)
+    assert len(samples) == 100
+    assert any(value != samples[0] for value in samples)
+
+
+def test_resource_signature_dedup():
+    # the running marker for a global-search proposal must be stored
+    # under the signature of the final config, including the resource
+    # attached by suggest, so error completions can delete it
+    import numpy as np
+    from flaml import tune
+    from flaml.searcher.blendsearch import BlendSearch
+
+    searcher = BlendSearch(
+        metric='loss', mode='min',
+        space={'x': tune.uniform(1, 9), 'y': tune.uniform(0, 2)},
+        prune_attr='resource', min_resource=1.0, max_resource=10.0)
+    rng = np.random.RandomState(0)
+    for i in range(60):
+        trial_id = f'trial{i}'
+        config = searcher.suggest(trial_id)
+        if config is None:
+            continue
+        assert searcher._ls.config_signature(config) in searcher._result
+        if rng.rand() < 0.5:
+            searcher.on_trial_complete(trial_id, error=True)
+        else:
+            searcher.on_trial_complete(trial_id, {
+                'loss': (config['x'] - 3) ** 2 + config['y'],
+                'config/x': config['x'], 'config/y': config['y'],
+                'resource': config.get('resource', 1.0)})